@@ -0,0 +1,37 @@
+function parseThreadCount(value: string | undefined, fallback: number): number {
+  const parsed = parseInt(value || '', 10);
+  return Number.isFinite(parsed) && parsed > 0 ? parsed : fallback;
+}
+
+// Number of PDFs downloaded at once; invalid values fall back to 8
+export const PDF_THREADS = parseThreadCount(process.env.PDF_THREADS, 8);
+
+// Number of PDFs parsed at once. pdf-parse runs on the main thread, so more
+// parses in flight only overlap file reads while each holds a whole pdf.js document
+export const PDF_PARSE_THREADS = parseThreadCount(process.env.PDF_PARSE_THREADS, 2);
+
+/**
+ * Run an async task over every item with at most `limit` tasks in flight.
+ * Results are returned in input order.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  task: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await task(items[index], index);
+    }
+  };
+
+  // A NaN limit would otherwise start no workers and return without running any task
+  const workerCount = Number.isNaN(limit) ? 1 : Math.max(1, Math.min(limit, items.length));
+  const workers = Array.from({ length: workerCount }, worker);
+  await Promise.all(workers);
+  return results;
+}
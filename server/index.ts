@@ -9,20 +9,31 @@ app.use(express.urlencoded({ extended: false }));
 app.use((req, res, next) => {
   const start = Date.now();
   const path = req.path;
-  let capturedJsonResponse: Record<string, any> | undefined = undefined;
+  let capturedJsonResponse: string | undefined = undefined;
+  let sendingJson = false;
 
   const originalResJson = res.json;
   res.json = function (bodyJson, ...args) {
-    capturedJsonResponse = bodyJson;
+    sendingJson = true;
     return originalResJson.apply(res, [bodyJson, ...args]);
   };
 
+  // res.json serialises the body and passes the string on to res.send, so keep
+  // that string for the log line instead of stringifying the response again
+  const originalResSend = res.send;
+  res.send = function (body, ...args) {
+    if (sendingJson && typeof body === "string") {
+      capturedJsonResponse = body;
+    }
+    return originalResSend.apply(res, [body, ...args]);
+  };
+
   res.on("finish", () => {
     const duration = Date.now() - start;
     if (path.startsWith("/api")) {
       let logLine = `${req.method} ${path} ${res.statusCode} in ${duration}ms`;
       if (capturedJsonResponse) {
-        logLine += ` :: ${JSON.stringify(capturedJsonResponse)}`;
+        logLine += ` :: ${capturedJsonResponse}`;
       }
 
       if (logLine.length > 80) {
@@ -66,5 +77,10 @@ app.use((req, res, next) => {
     reusePort: true,
   }, () => {
     log(`serving on port ${port}`);
+
+    // Pre-parse the building code PDFs in the background so the first search doesn't pay for it
+    import("./pdf-processor")
+      .then(({ pdfProcessor }) => pdfProcessor.warmCache())
+      .catch((error) => console.warn("PDF cache warmup failed:", error));
   });
 })();
@@ -1,10 +1,11 @@
 
-import axios from 'axios';
 import * as cheerio from 'cheerio';
 import fs from 'fs';
 import path from 'path';
-import { createHash } from 'crypto';
+import { createHash, randomUUID } from 'crypto';
 import { pdfProcessor } from './pdf-processor';
+import { fetchPDF, httpClient } from './pdf-cache';
+import { mapWithConcurrency, PDF_THREADS } from './concurrency';
 import { storage } from './storage';
 
 interface MBIEDocument {
@@ -30,6 +31,40 @@ interface MonitorConfig {
   };
 }
 
+interface MBIEIndexPage {
+  name: string;
+  url: string;
+  documentType: MBIEDocument['documentType'];
+  titlePatterns: readonly RegExp[];
+}
+
+// MBIE listing pages scanned for PDF links, with the link titles that identify each document type
+const MBIE_INDEX_PAGES: readonly MBIEIndexPage[] = Object.freeze([
+  {
+    name: 'building code updates',
+    url: 'https://www.building.govt.nz/building-code-compliance/building-code/',
+    documentType: 'building_code',
+    titlePatterns: [
+      /^[A-Z]\d+\s+/,  // B1, E2, G12, etc.
+      /building code/i,
+      /acceptable solution/i,
+      /verification method/i
+    ]
+  },
+  {
+    name: 'guidance documents',
+    url: 'https://www.building.govt.nz/building-code-compliance/building-code/guidance/',
+    documentType: 'guidance',
+    titlePatterns: [/guidance/i, /guide/i, /handbook/i, /manual/i]
+  },
+  {
+    name: 'amendment notices',
+    url: 'https://www.building.govt.nz/building-code-compliance/building-code/amendments/',
+    documentType: 'amendment',
+    titlePatterns: [/amendment/i, /change/i, /update/i, /revision/i]
+  }
+] as MBIEIndexPage[]);
+
 export class MBIEUpdateMonitor {
   private config: MonitorConfig;
   private monitoringInterval: NodeJS.Timeout | null = null;
@@ -84,17 +119,10 @@ export class MBIEUpdateMonitor {
     const updatedDocuments: MBIEDocument[] = [];
     
     try {
-      // Check Building Code documents
-      const buildingCodeUpdates = await this.checkBuildingCodeUpdates();
-      updatedDocuments.push(...buildingCodeUpdates);
-
-      // Check Guidance documents
-      const guidanceUpdates = await this.checkGuidanceDocuments();
-      updatedDocuments.push(...guidanceUpdates);
-
-      // Check Amendment notices
-      const amendmentUpdates = await this.checkAmendmentNotices();
-      updatedDocuments.push(...amendmentUpdates);
+      // Check Building Code documents, Guidance documents and Amendment notices
+      // concurrently - each is an independent page fetch
+      const pageUpdates = await Promise.all(MBIE_INDEX_PAGES.map(page => this.checkIndexPage(page)));
+      pageUpdates.forEach(updates => updatedDocuments.push(...updates));
 
       if (updatedDocuments.length > 0) {
         console.log(`📄 Found ${updatedDocuments.length} updated documents`);
@@ -112,60 +140,20 @@ export class MBIEUpdateMonitor {
     return updatedDocuments;
   }
 
-  private async checkBuildingCodeUpdates(): Promise<MBIEDocument[]> {
-    const buildingCodeUrl = 'https://www.building.govt.nz/building-code-compliance/building-code/';
-    const updates: MBIEDocument[] = [];
-
-    try {
-      const response = await axios.get(buildingCodeUrl);
-      const $ = cheerio.load(response.data);
-
-      // Look for PDF links in building code sections
-      $('a[href$=".pdf"]').each((_, element) => {
-        const link = $(element);
-        const href = link.attr('href');
-        const title = link.text().trim() || link.attr('title') || '';
-
-        if (href && this.isBuildingCodeDocument(title)) {
-          const fullUrl = href.startsWith('http') ? href : `https://www.building.govt.nz${href}`;
-          const checksum = this.generateChecksum(fullUrl + title);
-
-          const document: MBIEDocument = {
-            title,
-            url: fullUrl,
-            lastModified: new Date().toISOString(),
-            checksum,
-            documentType: 'building_code'
-          };
-
-          if (this.isDocumentUpdated(document)) {
-            updates.push(document);
-            this.knownDocuments.set(checksum, document);
-          }
-        }
-      });
-
-    } catch (error) {
-      console.error('Error checking building code updates:', error);
-    }
-
-    return updates;
-  }
-
-  private async checkGuidanceDocuments(): Promise<MBIEDocument[]> {
-    const guidanceUrl = 'https://www.building.govt.nz/building-code-compliance/building-code/guidance/';
+  private async checkIndexPage(page: MBIEIndexPage): Promise<MBIEDocument[]> {
     const updates: MBIEDocument[] = [];
 
     try {
-      const response = await axios.get(guidanceUrl);
+      const response = await httpClient.get(page.url);
       const $ = cheerio.load(response.data);
 
+      // Look for PDF links whose titles match this page's document type
       $('a[href$=".pdf"]').each((_, element) => {
         const link = $(element);
         const href = link.attr('href');
         const title = link.text().trim() || link.attr('title') || '';
 
-        if (href && this.isGuidanceDocument(title)) {
+        if (href && page.titlePatterns.some(pattern => pattern.test(title))) {
           const fullUrl = href.startsWith('http') ? href : `https://www.building.govt.nz${href}`;
           const checksum = this.generateChecksum(fullUrl + title);
 
@@ -174,7 +162,7 @@ export class MBIEUpdateMonitor {
             url: fullUrl,
             lastModified: new Date().toISOString(),
             checksum,
-            documentType: 'guidance'
+            documentType: page.documentType
           };
 
           if (this.isDocumentUpdated(document)) {
@@ -185,84 +173,12 @@ export class MBIEUpdateMonitor {
       });
 
     } catch (error) {
-      console.error('Error checking guidance documents:', error);
+      console.error(`Error checking ${page.name}:`, error);
     }
 
     return updates;
   }
 
-  private async checkAmendmentNotices(): Promise<MBIEDocument[]> {
-    const amendmentUrl = 'https://www.building.govt.nz/building-code-compliance/building-code/amendments/';
-    const updates: MBIEDocument[] = [];
-
-    try {
-      const response = await axios.get(amendmentUrl);
-      const $ = cheerio.load(response.data);
-
-      $('a[href$=".pdf"]').each((_, element) => {
-        const link = $(element);
-        const href = link.attr('href');
-        const title = link.text().trim() || link.attr('title') || '';
-
-        if (href && this.isAmendmentDocument(title)) {
-          const fullUrl = href.startsWith('http') ? href : `https://www.building.govt.nz${href}`;
-          const checksum = this.generateChecksum(fullUrl + title);
-
-          const document: MBIEDocument = {
-            title,
-            url: fullUrl,
-            lastModified: new Date().toISOString(),
-            checksum,
-            documentType: 'amendment'
-          };
-
-          if (this.isDocumentUpdated(document)) {
-            updates.push(document);
-            this.knownDocuments.set(checksum, document);
-          }
-        }
-      });
-
-    } catch (error) {
-      console.error('Error checking amendment notices:', error);
-    }
-
-    return updates;
-  }
-
-  private isBuildingCodeDocument(title: string): boolean {
-    const buildingCodePatterns = [
-      /^[A-Z]\d+\s+/,  // B1, E2, G12, etc.
-      /building code/i,
-      /acceptable solution/i,
-      /verification method/i
-    ];
-
-    return buildingCodePatterns.some(pattern => pattern.test(title));
-  }
-
-  private isGuidanceDocument(title: string): boolean {
-    const guidancePatterns = [
-      /guidance/i,
-      /guide/i,
-      /handbook/i,
-      /manual/i
-    ];
-
-    return guidancePatterns.some(pattern => pattern.test(title));
-  }
-
-  private isAmendmentDocument(title: string): boolean {
-    const amendmentPatterns = [
-      /amendment/i,
-      /change/i,
-      /update/i,
-      /revision/i
-    ];
-
-    return amendmentPatterns.some(pattern => pattern.test(title));
-  }
-
   private generateChecksum(content: string): string {
     return createHash('md5').update(content).digest('hex');
   }
@@ -280,31 +196,42 @@ export class MBIEUpdateMonitor {
     // Ensure download directory exists
     fs.mkdirSync(this.config.monitoring.pdf_storage_path, { recursive: true });
 
-    for (const document of documents) {
+    // Downloads are I/O-bound, so fetch and process several documents at once
+    await mapWithConcurrency(documents, PDF_THREADS, async (document) => {
       try {
         console.log(`📥 Downloading: ${document.title}`);
         
-        // Download PDF
-        const response = await axios.get(document.url, { responseType: 'arraybuffer' });
+        // Download PDF (served from the local cache when unchanged upstream)
+        const { data } = await fetchPDF(document.url);
+
+        // Keep the readable per-title copy that document sources point at. Titles
+        // can sanitise to the same filename, so write a temp file and rename it
+        // into place rather than letting concurrent writes interleave
         const filename = `${document.title.replace(/[^a-zA-Z0-9]/g, '_')}.pdf`;
         const filepath = path.join(this.config.monitoring.pdf_storage_path, filename);
-        
-        fs.writeFileSync(filepath, response.data);
+        const tmpPath = `${filepath}.${randomUUID()}.tmp`;
+        try {
+          await fs.promises.writeFile(tmpPath, data);
+          await fs.promises.rename(tmpPath, filepath);
+        } catch (error) {
+          await fs.promises.rm(tmpPath, { force: true });
+          throw error;
+        }
 
-        // Process with existing PDF processor
+        // Process with existing PDF processor, parsing the downloaded bytes directly
         await pdfProcessor.processPDF(filepath, {
           title: document.title,
           authority: 'MBIE',
           documentType: document.documentType,
           version: 'Latest'
-        });
+        }, data);
 
         console.log(`✅ Processed: ${document.title}`);
 
       } catch (error) {
         console.error(`❌ Error processing ${document.title}:`, error);
       }
-    }
+    });
 
     // Save updated known documents
     this.saveKnownDocuments();
@@ -0,0 +1,150 @@
+import axios from 'axios';
+import fs from 'fs';
+import http from 'http';
+import https from 'https';
+import os from 'os';
+import path from 'path';
+import { createHash, randomUUID } from 'crypto';
+import { pipeline } from 'stream/promises';
+
+// Downloaded PDFs are cached on disk by URL so repeat runs skip the network
+export const PDF_CACHE_DIR = process.env.PDF_CACHE_DIR || path.join(os.homedir(), '.cache', 'can-i-build-it', 'pdfs');
+
+// Shared client so repeat requests to the same host reuse pooled keep-alive connections
+export const httpClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 16 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 16 })
+});
+
+export function sha256(content: string | Buffer): string {
+  return createHash('sha256').update(content).digest('hex');
+}
+
+interface CacheValidators {
+  etag?: string;
+  lastModified?: string;
+}
+
+async function fileExists(filePath: string): Promise<boolean> {
+  try {
+    await fs.promises.access(filePath);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+async function readValidators(etagPath: string): Promise<CacheValidators> {
+  try {
+    return JSON.parse(await fs.promises.readFile(etagPath, 'utf-8'));
+  } catch {
+    return {};
+  }
+}
+
+export interface FetchedPDF {
+  filePath: string;
+  data: Buffer;
+}
+
+/**
+ * Fetch a PDF through the on-disk cache, revalidating with ETag/Last-Modified.
+ * Returns the cached file path along with the PDF bytes so callers can parse
+ * them without reading the file back.
+ */
+export async function fetchPDF(url: string, cacheDir: string = PDF_CACHE_DIR): Promise<FetchedPDF> {
+  const key = sha256(url);
+  const pdfPath = path.join(cacheDir, `${key}.pdf`);
+  const etagPath = path.join(cacheDir, `${key}.etag`);
+
+  const headers: Record<string, string> = {};
+  const cached = await fileExists(pdfPath);
+  if (cached) {
+    const validators = await readValidators(etagPath);
+    if (validators.etag) headers['If-None-Match'] = validators.etag;
+    if (validators.lastModified) headers['If-Modified-Since'] = validators.lastModified;
+  }
+
+  const response = await httpClient.get(url, {
+    responseType: 'stream',
+    timeout: 30000,
+    headers,
+    validateStatus: status => (status >= 200 && status < 300) || (cached && status === 304)
+  });
+
+  if (response.status === 304) {
+    // Drain the empty body so the keep-alive socket returns to the pool
+    response.data.resume();
+    console.log(`📦 Using cached PDF: ${url}`);
+    return { filePath: pdfPath, data: await fs.promises.readFile(pdfPath) };
+  }
+
+  // Stream the body to disk as it arrives rather than buffering the whole
+  // download first; write to a temp file so a failed transfer never replaces
+  // a good cache entry. The temp name is unique per call because the same URL
+  // can be downloaded concurrently (e.g. one PDF linked under two titles)
+  await fs.promises.mkdir(cacheDir, { recursive: true });
+  const tmpPath = `${pdfPath}.${randomUUID()}.tmp`;
+  try {
+    await pipeline(response.data, fs.createWriteStream(tmpPath));
+    await fs.promises.rename(tmpPath, pdfPath);
+  } catch (error) {
+    await fs.promises.rm(tmpPath, { force: true });
+    throw error;
+  }
+  // Read the bytes back rather than collecting chunks during the transfer: the
+  // file is still in the OS page cache, and only one copy is held in memory
+  const data = await fs.promises.readFile(pdfPath);
+
+  const validators: CacheValidators = {
+    etag: response.headers['etag'],
+    lastModified: response.headers['last-modified']
+  };
+  if (validators.etag || validators.lastModified) {
+    await fs.promises.writeFile(etagPath, JSON.stringify(validators));
+  } else {
+    await fs.promises.rm(etagPath, { force: true });
+  }
+
+  return { filePath: pdfPath, data };
+}
+
+// Parsed PDF text, keyed by the SHA-256 of the PDF bytes
+const TEXT_CACHE_DIR = path.join(PDF_CACHE_DIR, 'text');
+
+export async function readCachedText(pdfHash: string): Promise<string | null> {
+  try {
+    return await fs.promises.readFile(path.join(TEXT_CACHE_DIR, `${pdfHash}.txt`), 'utf-8');
+  } catch {
+    return null;
+  }
+}
+
+export async function writeCachedText(pdfHash: string, text: string): Promise<void> {
+  try {
+    await fs.promises.mkdir(TEXT_CACHE_DIR, { recursive: true });
+    await fs.promises.writeFile(path.join(TEXT_CACHE_DIR, `${pdfHash}.txt`), text, 'utf-8');
+  } catch (error: any) {
+    console.warn(`Could not cache PDF text: ${error.message || error}`);
+  }
+}
+
+/**
+ * Read/write a JSON value cached under PDF_CACHE_DIR/<kind>/<key>.json
+ */
+export async function readCachedJSON<T>(kind: string, key: string): Promise<T | null> {
+  try {
+    return JSON.parse(await fs.promises.readFile(path.join(PDF_CACHE_DIR, kind, `${key}.json`), 'utf-8'));
+  } catch {
+    return null;
+  }
+}
+
+export async function writeCachedJSON(kind: string, key: string, value: unknown): Promise<void> {
+  try {
+    await fs.promises.mkdir(path.join(PDF_CACHE_DIR, kind), { recursive: true });
+    await fs.promises.writeFile(path.join(PDF_CACHE_DIR, kind, `${key}.json`), JSON.stringify(value), 'utf-8');
+  } catch (error: any) {
+    console.warn(`Could not cache ${kind} result: ${error.message || error}`);
+  }
+}
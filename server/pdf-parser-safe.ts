@@ -34,10 +34,10 @@ export async function initializeSafePDFParser(): Promise<boolean> {
   return true;
 }
 
-export async function parsePDFSafely(filePath: string): Promise<string | null> {
+export async function parsePDFSafely(filePathOrBuffer: string | Buffer): Promise<string | null> {
   try {
-    if (!fs.existsSync(filePath)) {
-      console.log(`❌ File not found: ${filePath}`);
+    if (typeof filePathOrBuffer === 'string' && !fs.existsSync(filePathOrBuffer)) {
+      console.log(`❌ File not found: ${filePathOrBuffer}`);
       return null;
     }
 
@@ -47,7 +47,9 @@ export async function parsePDFSafely(filePath: string): Promise<string | null> {
       return null;
     }
 
-    const dataBuffer = fs.readFileSync(filePath);
+    const dataBuffer = typeof filePathOrBuffer === 'string'
+      ? await fs.promises.readFile(filePathOrBuffer)
+      : filePathOrBuffer;
     const pdfData = await pdfParseFunction(dataBuffer);
     const content = pdfData.text;
 
@@ -1,7 +1,10 @@
 import OpenAI from 'openai';
 import fs from 'fs';
 import path from 'path';
+import { createHash } from 'crypto';
 import { storage } from './storage';
+import { mapWithConcurrency, PDF_PARSE_THREADS } from './concurrency';
+import { sha256, readCachedText, writeCachedText, readCachedJSON, writeCachedJSON } from './pdf-cache';
 import type { 
   InsertBuildingCodeSection, 
   InsertPlanningRule, 
@@ -13,6 +16,96 @@ let pdfParse: any = null;
 
 const openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
 
+// Number of OpenAI extraction results kept in memory (older ones stay on disk)
+const EXTRACTION_CACHE_SIZE = 256;
+
+// the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
+const EXTRACTION_MODEL = "gpt-4o";
+
+const PDF_EXTRACTION_PROMPT = `You are an expert at extracting structured information from New Zealand building and planning documents. Extract relevant content and organize it into the appropriate categories.
+
+For Building Code documents, extract:
+- Code references (B1, E2, G12, etc.)
+- Section numbers and titles
+- Requirements and standards
+- Acceptable solutions
+- Verification methods
+
+For Planning documents, extract:
+- Zone information
+- Rule numbers and titles
+- Activity statuses (Permitted, Restricted Discretionary, etc.)
+- Standards (height limits, setbacks, site coverage)
+- Assessment criteria
+- Exemptions
+
+For Guidance documents, extract:
+- Activity types and descriptions
+- Consent requirements (building/resource)
+- Exemption conditions
+- Required documents
+- Professional requirements
+
+Return the extracted information as a JSON object with the following structure:
+{
+  "buildingCodeSections": [...],
+  "planningRules": [...], 
+  "consentRequirements": [...]
+}`;
+
+const TEXT_EXTRACTION_PROMPT = `Extract structured building and planning information from the provided text. Organize into building code sections, planning rules, and consent requirements as appropriate.
+
+Return as JSON with structure:
+{
+  "buildingCodeSections": [...],
+  "planningRules": [...],
+  "consentRequirements": [...]
+}`;
+
+function pdfExtractionInstruction(documentInfo: any): string {
+  return `Extract structured building and planning information from this ${documentInfo.documentType} document from ${documentInfo.authority}. Focus on practical rules, requirements, and guidance that property owners and developers would need to know.`;
+}
+
+function textExtractionHeader(documentInfo: any): string {
+  return `Document Type: ${documentInfo.documentType}
+Authority: ${documentInfo.authority}
+Region: ${documentInfo.region || 'National'}
+
+Text Content:
+`;
+}
+
+// Building-specific phrases pulled out of search queries
+const BUILDING_TERM_PATTERNS: readonly RegExp[] = [
+  /building\s+consent/gi,
+  /resource\s+consent/gi,
+  /building\s+code/gi,
+  /ventilation/gi,
+  /structural/gi,
+  /foundation/gi,
+  /durability/gi,
+  /moisture/gi,
+  /fire\s+safety/gi,
+  /access/gi,
+  /drainage/gi,
+  /plumbing/gi,
+  /energy\s+efficiency/gi,
+  /timber\s+frame/gi,
+  /concrete/gi,
+  /weatherproofing/gi,
+  /insulation/gi
+];
+
+// Count literal occurrences of a term without building a RegExp from user input
+function countOccurrences(haystack: string, needle: string): number {
+  if (!needle) return 0;
+  let count = 0;
+  for (let pos = haystack.indexOf(needle); pos !== -1; pos = haystack.indexOf(needle, pos + needle.length)) {
+    count++;
+  }
+  return count;
+}
+
 // Initialize PDF parser
 async function initializePDFParser() {
   if (!pdfParse) {
@@ -53,6 +146,10 @@ interface BuildingCodeClause {
 
 export class PDFProcessor {
 
+  private parsedTextCache = new Map<string, { mtimeMs: number; size: number; text: string }>();
+  private extractionCache = new Map<string, ExtractedContent>();
+  private pendingReads = new Map<string, Promise<string | null>>();
+
   private clausePatterns = {
     // Main clauses like D1, E2, B1, etc.
     mainClause: /^([A-Z]\d+)\s+(.+?)(?:\n|$)/gm,
@@ -281,7 +378,8 @@ export class PDFProcessor {
   }
 
   /**
-   * Process a PDF document and extract structured building/planning information
+   * Process a PDF document and extract structured building/planning information.
+   * Pass `pdfData` when the bytes are already in memory to skip re-reading the file.
    */
   async processPDF(filePath: string, documentInfo: {
     title: string;
@@ -289,7 +387,7 @@ export class PDFProcessor {
     documentType: 'building_code' | 'planning_rules' | 'guidance';
     region?: string;
     version?: string;
-  }): Promise<number> {
+  }, pdfData?: Buffer): Promise<number> {
 
     if (!process.env.OPENAI_API_KEY) {
       throw new Error('OpenAI API key is required for PDF processing');
@@ -309,8 +407,7 @@ export class PDFProcessor {
       });
 
       // Read and process PDF content using OpenAI
-      const pdfBuffer = fs.readFileSync(filePath);
-      const base64Pdf = pdfBuffer.toString('base64');
+      const pdfBuffer = pdfData || fs.readFileSync(filePath);
 
       // First try advanced clause extraction for building codes
       let sectionsCount = 0;
@@ -320,25 +417,23 @@ export class PDFProcessor {
         const pdfText = await this.extractTextFromPDF(pdfBuffer);
         const clauses = this.extractBuildingCodeClauses(pdfText);
 
-        // Convert clauses to building code sections
-        for (const clause of clauses) {
-          await storage.createBuildingCodeSection({
-            code: clause.clauseNumber.split('.')[0], // e.g., "D1" from "D1.3.3"
-            title: clause.title,
-            section: clause.clauseNumber,
-            content: clause.content,
-            category: this.determineCategoryFromCode(clause.clauseNumber),
-            subcategory: clause.title,
-            applicableTo: ['residential', 'commercial'],
-            requirements: [clause.content],
-            acceptableSolutions: [],
-            verificationMethods: [],
-            sourceDocument: documentInfo.title,
-            documentVersion: documentInfo.version,
-            isActive: true
-          });
-          sectionsCount++;
-        }
+        // Convert clauses to building code sections, inserted in batches
+        await storage.createBuildingCodeSections(clauses.map(clause => ({
+          code: clause.clauseNumber.split('.')[0], // e.g., "D1" from "D1.3.3"
+          title: clause.title,
+          section: clause.clauseNumber,
+          content: clause.content,
+          category: this.determineCategoryFromCode(clause.clauseNumber),
+          subcategory: clause.title,
+          applicableTo: ['residential', 'commercial'],
+          requirements: [clause.content],
+          acceptableSolutions: [],
+          verificationMethods: [],
+          sourceDocument: documentInfo.title,
+          documentVersion: documentInfo.version,
+          isActive: true
+        })));
+        sectionsCount += clauses.length;
 
         // Create RAG chunks for enhanced search
         const ragChunks = this.createRAGChunks(clauses, documentInfo.title);
@@ -346,35 +441,33 @@ export class PDFProcessor {
 
       } else {
         // Fallback to AI extraction for other document types
-        const extractedContent = await this.extractContentWithAI(base64Pdf, documentInfo);
+        const extractedContent = await this.cachedExtraction(
+          this.extractionKey(PDF_EXTRACTION_PROMPT, pdfExtractionInstruction(documentInfo), pdfBuffer),
+          // Only the AI path needs a base64 copy of the PDF, so encode it lazily
+          () => this.extractContentWithAI(pdfBuffer.toString('base64'), documentInfo)
+        );
 
         // Process building code sections
-        for (const section of extractedContent.buildingCodeSections) {
-          await storage.createBuildingCodeSection({
-            ...section,
-            sourceDocument: documentInfo.title
-          });
-          sectionsCount++;
-        }
+        await storage.createBuildingCodeSections(extractedContent.buildingCodeSections.map(section => ({
+          ...section,
+          sourceDocument: documentInfo.title
+        })));
+        sectionsCount += extractedContent.buildingCodeSections.length;
       }
 
       // Process planning rules
-      for (const rule of extractedContent.planningRules) {
-        await storage.createPlanningRule({
-          ...rule,
-          sourceDocument: documentInfo.title
-        });
-        sectionsCount++;
-      }
+      await storage.createPlanningRules(extractedContent.planningRules.map(rule => ({
+        ...rule,
+        sourceDocument: documentInfo.title
+      })));
+      sectionsCount += extractedContent.planningRules.length;
 
       // Process consent requirements
-      for (const requirement of extractedContent.consentRequirements) {
-        await storage.createConsentRequirement({
-          ...requirement,
-          sourceReference: documentInfo.title
-        });
-        sectionsCount++;
-      }
+      await storage.createConsentRequirements(extractedContent.consentRequirements.map(requirement => ({
+        ...requirement,
+        sourceReference: documentInfo.title
+      })));
+      sectionsCount += extractedContent.consentRequirements.length;
 
       // Update document processing status
       await storage.updateDocumentSource(documentSource.id, {
@@ -391,54 +484,60 @@ export class PDFProcessor {
   }
 
   /**
-   * Extract structured content from PDF using OpenAI
+   * Cache key for a chat completion extraction. Covers the model and the full
+   * prompt sent alongside the content, so changing either misses old results.
    */
-  private async extractContentWithAI(base64Pdf: string, documentInfo: any): Promise<ExtractedContent> {
-
-    const systemPrompt = `You are an expert at extracting structured information from New Zealand building and planning documents. Extract relevant content and organize it into the appropriate categories.
+  private extractionKey(systemPrompt: string, instruction: string, content: string | Buffer): string {
+    // Hash incrementally so the PDF buffer is never copied
+    return createHash('sha256')
+      .update(JSON.stringify([EXTRACTION_MODEL, systemPrompt, instruction]) + '\n')
+      .update(content)
+      .digest('hex');
+  }
 
-For Building Code documents, extract:
-- Code references (B1, E2, G12, etc.)
-- Section numbers and titles
-- Requirements and standards
-- Acceptable solutions
-- Verification methods
+  /**
+   * Return the AI extraction for identical content from memory or disk before calling OpenAI
+   */
+  private async cachedExtraction(key: string, extract: () => Promise<ExtractedContent>): Promise<ExtractedContent> {
+    const memo = this.extractionCache.get(key);
+    if (memo) {
+      // Re-insert so Map order tracks least recently used
+      this.extractionCache.delete(key);
+      this.extractionCache.set(key, memo);
+      return memo;
+    }
 
-For Planning documents, extract:
-- Zone information
-- Rule numbers and titles
-- Activity statuses (Permitted, Restricted Discretionary, etc.)
-- Standards (height limits, setbacks, site coverage)
-- Assessment criteria
-- Exemptions
+    let extracted = await readCachedJSON<ExtractedContent>('extractions', key);
+    if (!extracted) {
+      extracted = await extract();
+      await writeCachedJSON('extractions', key, extracted);
+    }
 
-For Guidance documents, extract:
-- Activity types and descriptions
-- Consent requirements (building/resource)
-- Exemption conditions
-- Required documents
-- Professional requirements
+    this.extractionCache.set(key, extracted);
+    if (this.extractionCache.size > EXTRACTION_CACHE_SIZE) {
+      this.extractionCache.delete(this.extractionCache.keys().next().value);
+    }
+    return extracted;
+  }
 
-Return the extracted information as a JSON object with the following structure:
-{
-  "buildingCodeSections": [...],
-  "planningRules": [...], 
-  "consentRequirements": [...]
-}`;
+  /**
+   * Extract structured content from PDF using OpenAI
+   */
+  private async extractContentWithAI(base64Pdf: string, documentInfo: any): Promise<ExtractedContent> {
 
     const response = await openai.chat.completions.create({
-      model: "gpt-4o", // the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
+      model: EXTRACTION_MODEL,
       messages: [
         {
           role: "system",
-          content: systemPrompt
+          content: PDF_EXTRACTION_PROMPT
         },
         {
           role: "user",
           content: [
             {
               type: "text",
-              text: `Extract structured building and planning information from this ${documentInfo.documentType} document from ${documentInfo.authority}. Focus on practical rules, requirements, and guidance that property owners and developers would need to know.`
+              text: pdfExtractionInstruction(documentInfo)
             },
             {
               type: "image_url",
@@ -492,34 +591,31 @@ Return the extracted information as a JSON object with the following structure:
         processingStatus: 'processing'
       });
 
-      const extractedContent = await this.extractContentFromText(content, documentInfo);
+      const extractedContent = await this.cachedExtraction(
+        this.extractionKey(TEXT_EXTRACTION_PROMPT, textExtractionHeader(documentInfo), content),
+        () => this.extractContentFromText(content, documentInfo)
+      );
 
       // Store extracted content
       let sectionsCount = 0;
 
-      for (const section of extractedContent.buildingCodeSections) {
-        await storage.createBuildingCodeSection({
-          ...section,
-          sourceDocument: documentInfo.title
-        });
-        sectionsCount++;
-      }
+      await storage.createBuildingCodeSections(extractedContent.buildingCodeSections.map(section => ({
+        ...section,
+        sourceDocument: documentInfo.title
+      })));
+      sectionsCount += extractedContent.buildingCodeSections.length;
 
-      for (const rule of extractedContent.planningRules) {
-        await storage.createPlanningRule({
-          ...rule,
-          sourceDocument: documentInfo.title
-        });
-        sectionsCount++;
-      }
+      await storage.createPlanningRules(extractedContent.planningRules.map(rule => ({
+        ...rule,
+        sourceDocument: documentInfo.title
+      })));
+      sectionsCount += extractedContent.planningRules.length;
 
-      for (const requirement of extractedContent.consentRequirements) {
-        await storage.createConsentRequirement({
-          ...requirement,
-          sourceReference: documentInfo.title
-        });
-        sectionsCount++;
-      }
+      await storage.createConsentRequirements(extractedContent.consentRequirements.map(requirement => ({
+        ...requirement,
+        sourceReference: documentInfo.title
+      })));
+      sectionsCount += extractedContent.consentRequirements.length;
 
       await storage.updateDocumentSource(documentSource.id, {
         processingStatus: 'completed',
@@ -539,27 +635,15 @@ Return the extracted information as a JSON object with the following structure:
    */
   private async extractContentFromText(content: string, documentInfo: any): Promise<ExtractedContent> {
     const response = await openai.chat.completions.create({
-      model: "gpt-4o", // the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
+      model: EXTRACTION_MODEL,
       messages: [
         {
           role: "system",
-          content: `Extract structured building and planning information from the provided text. Organize into building code sections, planning rules, and consent requirements as appropriate.
-
-Return as JSON with structure:
-{
-  "buildingCodeSections": [...],
-  "planningRules": [...],
-  "consentRequirements": [...]
-}`
+          content: TEXT_EXTRACTION_PROMPT
         },
         {
           role: "user",
-          content: `Document Type: ${documentInfo.documentType}
-Authority: ${documentInfo.authority}
-Region: ${documentInfo.region || 'National'}
-
-Text Content:
-${content}`
+          content: textExtractionHeader(documentInfo) + content
         }
       ],
       response_format: { type: "json_object" },
@@ -589,6 +673,17 @@ ${content}`
       .filter(file => !file.includes('_')); // Filter out duplicates with timestamps
   }
 
+  /**
+   * Parse every available PDF ahead of time so the first chat search is served from the text cache
+   */
+  async warmCache(): Promise<void> {
+    const availablePDFs = this.getAvailablePDFs();
+    const start = Date.now();
+    const contents = await mapWithConcurrency(availablePDFs, PDF_PARSE_THREADS, filename => this.readUploadedPDF(filename));
+    const parsed = contents.filter(Boolean).length;
+    console.log(`🔥 Warmed PDF text cache: ${parsed}/${availablePDFs.length} documents in ${Date.now() - start}ms`);
+  }
+
   /**
    * Extract text from PDF buffer
    */
@@ -622,6 +717,18 @@ ${content}`
    * Read and extract text from uploaded PDF
    */
   async readUploadedPDF(filename: string): Promise<string | null> {
+    // Share a parse that is already in flight (e.g. from warmCache) instead of starting another
+    const pending = this.pendingReads.get(filename);
+    if (pending) {
+      return pending;
+    }
+
+    const read = this.loadUploadedPDF(filename).finally(() => this.pendingReads.delete(filename));
+    this.pendingReads.set(filename, read);
+    return read;
+  }
+
+  private async loadUploadedPDF(filename: string): Promise<string | null> {
     try {
       const assetsDir = path.join(process.cwd(), 'attached_assets');
       const filePath = path.join(assetsDir, filename);
@@ -631,12 +738,30 @@ ${content}`
         return null;
       }
 
-      // Use safe PDF parser that doesn't trigger test files
-      const { parsePDFSafely } = await import('./pdf-parser-safe');
-      const content = await parsePDFSafely(filePath);
+      // Reuse text parsed earlier in this process while the file is unchanged
+      const stats = await fs.promises.stat(filePath);
+      const memo = this.parsedTextCache.get(filePath);
+      if (memo && memo.mtimeMs === stats.mtimeMs && memo.size === stats.size) {
+        return memo.text;
+      }
+
+      // Otherwise look for text parsed by an earlier run, keyed by the PDF contents
+      const pdfBuffer = await fs.promises.readFile(filePath);
+      const pdfHash = sha256(pdfBuffer);
+      let content = await readCachedText(pdfHash);
+
+      if (!content) {
+        // Use safe PDF parser that doesn't trigger test files
+        const { parsePDFSafely } = await import('./pdf-parser-safe');
+        content = await parsePDFSafely(pdfBuffer);
+        if (content) {
+          await writeCachedText(pdfHash, content);
+        }
+      }
 
       if (content) {
         console.log(`✅ Successfully parsed ${filename}: ${content.length} characters`);
+        this.parsedTextCache.set(filePath, { mtimeMs: stats.mtimeMs, size: stats.size, text: content });
         return content;
       } else {
         console.log(`❌ Failed to parse ${filename}`);
@@ -649,18 +774,30 @@ ${content}`
   }
 
   /**
-   * Find specific building code clause in text
+   * Compile the clause lookup patterns once so they can be reused across documents
    */
-  findClause(text: string, clauseNumber: string): { clauseNumber: string; content?: string; found: boolean; source?: string } {
+  private buildClausePatterns(clauseNumber: string): RegExp[] {
     // Handle both "D1 3.3" and "D1.3.3" formats
     const normalized = clauseNumber.replace(/\s+/g, '.');
 
     // Look for the clause in the text - more flexible pattern
-    const patterns = [
+    return [
       new RegExp(`${normalized}[^\\n]*([\\s\\S]*?)(?=\\n[A-Z]\\d+|$)`, 'i'),
       new RegExp(`${clauseNumber}[^\\n]*([\\s\\S]*?)(?=\\n[A-Z]\\d+|$)`, 'i'),
       new RegExp(`${normalized}[\\s\\S]*?(?=\\n\\d+\\.|\\n[A-Z]\\d+|$)`, 'i')
     ];
+  }
+
+  /**
+   * Find specific building code clause in text
+   */
+  findClause(
+    text: string,
+    clauseNumber: string,
+    patterns: RegExp[] = this.buildClausePatterns(clauseNumber)
+  ): { clauseNumber: string; content?: string; found: boolean; source?: string } {
+    // Handle both "D1 3.3" and "D1.3.3" formats
+    const normalized = clauseNumber.replace(/\s+/g, '.');
 
     for (const pattern of patterns) {
       const match = text.match(pattern);
@@ -686,80 +823,84 @@ ${content}`
 
     console.log(`Searching ${availablePDFs.length} PDFs for: "${query}"`);
 
+    // Parse every PDF once, overlapping file reads with parsing
+    const contents = await mapWithConcurrency(availablePDFs, PDF_PARSE_THREADS, filename => this.readUploadedPDF(filename));
+
     // Check for specific clause request (e.g., B1, D1.3.3, E2/AS1)
     const clauseMatch = query.match(/([A-Z]\d+(?:[\/\.]\w*\d*)*(?:\s+\d+(?:\.\d+)*)?)/i);
-
-    if (clauseMatch) {
-      const clauseNumber = clauseMatch[1];
+    const clauseNumber = clauseMatch ? clauseMatch[1] : null;
+    const clausePatterns = clauseNumber ? this.buildClausePatterns(clauseNumber) : [];
+    if (clauseNumber) {
       console.log(`Looking for specific clause: ${clauseNumber}`);
-
-      // Search through uploaded files for specific clauses
-      for (const filename of availablePDFs) {
-        const content = await this.readUploadedPDF(filename);
-        if (content) {
-          const result = this.findClause(content, clauseNumber);
-          if (result.found) {
-            results.push({
-              clauseNumber: result.clauseNumber,
-              content: result.content,
-              source: filename,
-              type: 'building_code_clause',
-              relevance: 100
-            });
-            if (!sources.includes(filename)) {
-              sources.push(filename);
-            }
-          }
-        }
-      }
     }
 
     // Enhanced general search with building-specific terms
     const buildingTerms = this.extractBuildingTerms(query);
+    const lowerTerms = buildingTerms.map(term => term.toLowerCase());
     console.log('Building terms extracted:', buildingTerms);
 
-    for (const filename of availablePDFs) {
-      const content = await this.readUploadedPDF(filename);
-      if (content) {
-        const lowerContent = content.toLowerCase();
-        let matchScore = 0;
+    // Single pass per document: clause lookup and term scoring share the same text
+    availablePDFs.forEach((filename, index) => {
+      const content = contents[index];
+      if (!content) {
+        return;
+      }
 
-        // Score based on building-specific terms
-        for (const term of buildingTerms) {
-          const termMatches = (lowerContent.match(new RegExp(term.toLowerCase(), 'g')) || []).length;
-          matchScore += termMatches * (term.length > 4 ? 3 : 1); // Weight longer terms higher
+      let clauseResult: any = null;
+      let matched = false;
+      if (clauseNumber) {
+        const result = this.findClause(content, clauseNumber, clausePatterns);
+        if (result.found) {
+          clauseResult = {
+            clauseNumber: result.clauseNumber,
+            content: result.content,
+            source: filename,
+            type: 'building_code_clause',
+            relevance: 100
+          };
+          results.push(clauseResult);
+          matched = true;
         }
+      }
 
-        if (matchScore > 2) { // Require minimum relevance
-          // Extract most relevant sections
-          const relevantSections = this.extractRelevantSections(content, buildingTerms);
-          
-          if (relevantSections.length > 0) {
-            const existingResult = results.find(r => r.source === filename);
-            if (existingResult) {
-              // Merge with existing clause result
-              existingResult.content += '\n\nAdditional relevant content:\n' + relevantSections.join('\n\n');
-              existingResult.relevance += matchScore;
-            } else {
-              // Add new general search result
-              results.push({
-                content: relevantSections.join('\n\n'),
-                source: filename,
-                type: 'general_search',
-                relevance: matchScore,
-                matchTerms: buildingTerms.filter(term => 
-                  lowerContent.includes(term.toLowerCase())
-                )
-              });
-            }
-            
-            if (!sources.includes(filename)) {
-              sources.push(filename);
-            }
+      const lowerContent = content.toLowerCase();
+      let matchScore = 0;
+
+      // Score based on building-specific terms
+      lowerTerms.forEach(term => {
+        const termMatches = countOccurrences(lowerContent, term);
+        matchScore += termMatches * (term.length > 4 ? 3 : 1); // Weight longer terms higher
+      });
+
+      if (matchScore > 2) { // Require minimum relevance
+        // Extract most relevant sections
+        const relevantSections = this.extractRelevantSections(content, buildingTerms);
+
+        if (relevantSections.length > 0) {
+          matched = true;
+          if (clauseResult) {
+            // Merge with existing clause result
+            clauseResult.content += '\n\nAdditional relevant content:\n' + relevantSections.join('\n\n');
+            clauseResult.relevance += matchScore;
+          } else {
+            // Add new general search result
+            results.push({
+              content: relevantSections.join('\n\n'),
+              source: filename,
+              type: 'general_search',
+              relevance: matchScore,
+              matchTerms: buildingTerms.filter((term, termIndex) =>
+                lowerContent.includes(lowerTerms[termIndex])
+              )
+            });
           }
         }
       }
-    }
+
+      if (matched) {
+        sources.push(filename);
+      }
+    });
 
     // Sort results by relevance
     results.sort((a, b) => (b.relevance || 0) - (a.relevance || 0));
@@ -783,27 +924,7 @@ ${content}`
     });
 
     // Building-specific patterns
-    const buildingPatterns = [
-      /building\s+consent/gi,
-      /resource\s+consent/gi,
-      /building\s+code/gi,
-      /ventilation/gi,
-      /structural/gi,
-      /foundation/gi,
-      /durability/gi,
-      /moisture/gi,
-      /fire\s+safety/gi,
-      /access/gi,
-      /drainage/gi,
-      /plumbing/gi,
-      /energy\s+efficiency/gi,
-      /timber\s+frame/gi,
-      /concrete/gi,
-      /weatherproofing/gi,
-      /insulation/gi
-    ];
-
-    buildingPatterns.forEach(pattern => {
+    BUILDING_TERM_PATTERNS.forEach(pattern => {
       const matches = query.match(pattern);
       if (matches) {
         matches.forEach(match => terms.add(match.toLowerCase()));
@@ -814,35 +935,117 @@ ${content}`
   }
 
   /**
-   * Extract relevant sections with better context
+   * Extract relevant sections with better context.
+   * Jumps straight to term matches instead of splitting and lowercasing every
+   * sentence of the document; sentence boundaries are only located as far as needed.
    */
   private extractRelevantSections(content: string, searchTerms: string[]): string[] {
     const sections: string[] = [];
-    const sentences = content.split(/\.\s+/);
-    
-    for (let i = 0; i < sentences.length; i++) {
-      const sentence = sentences[i];
-      const sentenceLower = sentence.toLowerCase();
-      
-      // Check if sentence contains any search terms
-      const hasMatch = searchTerms.some(term => 
-        sentenceLower.includes(term.toLowerCase())
-      );
-      
-      if (hasMatch && sentence.length > 50) {
+    const terms = searchTerms.filter(term => term.length > 0);
+    if (terms.length === 0) {
+      return sections;
+    }
+
+    // Shortest terms first, so at any position the alternation takes the match
+    // that ends earliest; a longer term crossing a sentence end must not hide a
+    // shorter one (e.g. "ventilation." vs "ventilation") that fits inside it
+    const alternatives = [...terms].sort((a, b) => a.length - b.length).map(escapeRegExp);
+    const termPattern = new RegExp(alternatives.join('|'), 'gi');
+    const sentences = new SentenceSpans(content);
+    let sentenceIndex = 0;
+    let match: RegExpExecArray | null;
+
+    while ((match = termPattern.exec(content)) !== null) {
+      const i = sentences.indexAt(match.index, sentenceIndex);
+      const [start, end] = sentences.get(i);
+
+      // A match running into the ". " separator is not inside any sentence
+      if (match.index + match[0].length > end) {
+        termPattern.lastIndex = match.index + 1;
+        continue;
+      }
+
+      if (end - start > 50) {
         // Include context: previous and next sentences
         const startIndex = Math.max(0, i - 1);
-        const endIndex = Math.min(sentences.length - 1, i + 2);
-        const contextualSection = sentences.slice(startIndex, endIndex + 1).join('. ');
-        
-        if (contextualSection.length > 100 && sections.length < 4) {
+        const endIndex = Math.min(sentences.lastIndexUpTo(i + 2), i + 2);
+        const contextualSection = sentences.slice(startIndex, endIndex).join('. ');
+
+        if (contextualSection.length > 100) {
           sections.push(contextualSection + '.');
+          // Nothing past the cap is returned, so stop scanning the document
+          if (sections.length >= 4) break;
         }
       }
+
+      // Resume the search at the next sentence
+      if (sentences.lastIndexUpTo(i + 1) === i) break;
+      sentenceIndex = i + 1;
+      termPattern.lastIndex = sentences.get(sentenceIndex)[0];
     }
-    
+
     return sections;
   }
 }
 
+function escapeRegExp(text: string): string {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+/**
+ * Sentence spans of a document, split the same way as `text.split(/\.\s+/)`
+ * but discovered lazily so only the part of the text actually visited is scanned.
+ */
+class SentenceSpans {
+  private starts: number[] = [];
+  private ends: number[] = [];
+  private boundary = /\.\s+/g;
+  private nextStart = 0;
+  private done = false;
+
+  constructor(private text: string) {}
+
+  private scanNext(): void {
+    const match = this.boundary.exec(this.text);
+    this.starts.push(this.nextStart);
+    if (match) {
+      this.ends.push(match.index);
+      this.nextStart = match.index + match[0].length;
+    } else {
+      this.ends.push(this.text.length);
+      this.done = true;
+    }
+  }
+
+  /** Highest known sentence index not above `index`, scanning ahead as needed */
+  lastIndexUpTo(index: number): number {
+    while (this.starts.length <= index && !this.done) {
+      this.scanNext();
+    }
+    return Math.min(index, this.starts.length - 1);
+  }
+
+  get(index: number): [number, number] {
+    this.lastIndexUpTo(index);
+    return [this.starts[index], this.ends[index]];
+  }
+
+  /** Index of the sentence (plus trailing separator) containing `position`, searching forward from `from` */
+  indexAt(position: number, from: number): number {
+    let i = from;
+    while (this.lastIndexUpTo(i + 1) > i && this.starts[i + 1] <= position) {
+      i++;
+    }
+    return i;
+  }
+
+  slice(first: number, last: number): string[] {
+    const parts: string[] = [];
+    for (let i = first; i <= last; i++) {
+      parts.push(this.text.slice(this.starts[i], this.ends[i]));
+    }
+    return parts;
+  }
+}
+
 export const pdfProcessor = new PDFProcessor();
\ No newline at end of file
@@ -146,8 +146,10 @@ export class PDFReader {
         const endIndex = Math.min(sentences.length - 1, i + 2);
         const contextualSection = sentences.slice(startIndex, endIndex + 1).join('. ');
         
-        if (contextualSection.length > 50 && sections.length < 3) {
+        if (contextualSection.length > 50) {
           sections.push(contextualSection);
+          // Nothing past the cap is returned, so stop scanning the document
+          if (sections.length >= 3) break;
         }
       }
     }
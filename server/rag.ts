@@ -1,5 +1,5 @@
 import { db } from './db';
-import { UNITARY_PLAN_ASSISTANT_PROMPT } from './prompts';
+import { PROPERTY_ADVISOR_PROMPT, RAG_RESPONSE_REQUIREMENTS, UNITARY_PLAN_ASSISTANT_PROMPT } from './prompts';
 
 interface KnowledgeBase {
   id: string;
@@ -237,21 +237,22 @@ const nzBuildingKnowledge: KnowledgeBase[] = [
   }
 ];
 
+// Clause reference formats recognised in user queries
+const CLAUSE_REFERENCE_PATTERNS: readonly RegExp[] = [
+  /\b([A-Z]\d+(?:\.\d+)*(?:\.\d+)*)\b/g, // B1, E2.3.1, G4.2
+  /\b([A-Z]\d+\s+\d+(?:\.\d+)*)\b/g, // B1 3.1, E2 3.1.2
+  /Building Code\s+([A-Z]\d+(?:\.\d+)*)/gi,
+  /NZBC\s+([A-Z]\d+(?:\.\d+)*)/gi,
+  /clause\s+([A-Z]\d+(?:\.\d+)*)/gi
+];
+
 /**
  * Extract specific Building Code clauses from query
  */
 export function extractBuildingCodeClauses(query: string): string[] {
-  const clausePatterns = [
-    /\b([A-Z]\d+(?:\.\d+)*(?:\.\d+)*)\b/g, // B1, E2.3.1, G4.2
-    /\b([A-Z]\d+\s+\d+(?:\.\d+)*)\b/g, // B1 3.1, E2 3.1.2
-    /Building Code\s+([A-Z]\d+(?:\.\d+)*)/gi,
-    /NZBC\s+([A-Z]\d+(?:\.\d+)*)/gi,
-    /clause\s+([A-Z]\d+(?:\.\d+)*)/gi
-  ];
-
   const clauses = new Set<string>();
 
-  clausePatterns.forEach(pattern => {
+  CLAUSE_REFERENCE_PATTERNS.forEach(pattern => {
     const matches = query.matchAll(pattern);
     for (const match of matches) {
       if (match[1]) {
@@ -273,6 +274,11 @@ export function searchKnowledgeBase(query: string, category?: KnowledgeBase['cat
 
   // Extract specific clauses mentioned in the query
   const requestedClauses = extractBuildingCodeClauses(query);
+  // Compile each clause matcher once rather than per knowledge base entry
+  const requestedClausePatterns = requestedClauses.map(clause => ({
+    clause,
+    pattern: new RegExp(clause.replace(/\./g, '\\.'), 'i')
+  }));
 
   let results = nzBuildingKnowledge.filter(item => {
     if (category && item.category !== category) return false;
@@ -293,9 +299,8 @@ export function searchKnowledgeBase(query: string, category?: KnowledgeBase['cat
     let score = 0;
 
     // HIGHEST PRIORITY: Exact clause matches
-    if (requestedClauses.length > 0) {
-      requestedClauses.forEach(clause => {
-        const clausePattern = new RegExp(clause.replace(/\./g, '\\.'), 'i');
+    if (requestedClausePatterns.length > 0) {
+      requestedClausePatterns.forEach(({ clause, pattern: clausePattern }) => {
         if (clausePattern.test(item.content) || clausePattern.test(item.source || '')) {
           score += 2000; // Extremely high priority for exact clause matches
         }
@@ -487,6 +492,8 @@ SOURCE: MBIE Building Consent Exemptions Guide - Schedule 1 Building Act 2004`;
 
   // Build comprehensive context with specific clause information
   let clauseContext = '';
+  // Entries already quoted as exact clause matches are not repeated in the general context
+  const quotedEntryIds = new Set<string>();
   if (requestedClauses.length > 0) {
     clauseContext = `\n\nSPECIFIC BUILDING CODE CLAUSES REQUESTED: ${requestedClauses.join(', ')}\n`;
 
@@ -502,6 +509,7 @@ SOURCE: MBIE Building Consent Exemptions Guide - Schedule 1 Building Act 2004`;
       clauseContext += '\nEXACT CLAUSE INFORMATION FROM BUILDING CODE:\n';
       clauseMatches.forEach(match => {
         clauseContext += `${match.source}: ${match.content}\n\n`;
+        quotedEntryIds.add(match.id);
       });
     }
   }
@@ -566,9 +574,10 @@ SOURCE: MBIE Building Consent Exemptions Guide - Schedule 1 Building Act 2004`;
   }
   
   // Static knowledge base regulations
-  if (relevantInfo.length > 0) {
+  const additionalInfo = relevantInfo.slice(0, 4).filter(info => !quotedEntryIds.has(info.id));
+  if (additionalInfo.length > 0) {
     knowledgeContext += '\nRELEVANT NZ BUILDING REGULATIONS:\n';
-    relevantInfo.slice(0, 4).forEach((info, index) => {
+    additionalInfo.forEach((info, index) => {
       knowledgeContext += `${index + 1}. ${info.content}\n   Source: ${info.source}\n\n`;
     });
   }
@@ -597,108 +606,7 @@ Would you like to set up AI assistance so I can provide detailed property and bu
     // Choose prompt based on context
     const systemPrompt = promptType === 'planning'
       ? UNITARY_PLAN_ASSISTANT_PROMPT
-      : `You are an expert New Zealand property development advisor with access to comprehensive, real-time data sources including Auckland Council records, property market analysis, and official MBIE building regulations. You provide AUTHORITATIVE, SPECIFIC answers based on multiple official data sources.
-
-            DATA SOURCES AVAILABLE:
-            - Auckland Council property records, zoning, and planning constraints (when accessible)
-            - Real-time property market analysis and development potential data (when accessible)
-            - Official MBIE Building Code documents and regulations
-            - Infrastructure constraint data (including Watercare restrictions)
-            - Property research including demographics and growth projections (when accessible)
-            - Comprehensive building consent exemption guidance
-
-            CRITICAL DATA INTEGRITY REQUIREMENTS:
-            - NEVER generate, assume, or mention property zoning information unless provided in the available knowledge
-            - NEVER create synthetic property values, land areas, or market data
-            - NEVER mention specific zoning types (Mixed Housing Suburban, etc.) unless confirmed by authentic data
-            - Only comment on property information that is explicitly provided in the available knowledge section
-            - If property data is not available, clearly state this limitation
-            
-            BUILDING CONSENT vs PLANNING CONSENT DISTINCTION:
-            - ALWAYS provide general Building Code and Schedule 1 exemption guidance regardless of specific property details
-            - Building consent requirements are universal across New Zealand under the Building Act 2004
-            - Schedule 1 exemptions apply everywhere and don't depend on zoning or property-specific factors
-            - Explain general building consent thresholds (e.g., carports under 20m², single-storey buildings under 10m²)
-            - Resource consent and planning rules are property-specific and require zoning information
-            - Focus on building regulations first, then mention planning considerations if relevant
-
-            EXPERT RESPONSE REQUIREMENTS:
-            - Only integrate data sources that contain authentic information
-            - When property data is unavailable, focus solely on building regulations
-            - Combine building regulations with property-specific constraints ONLY when real constraint data is available
-            - Never assume or generate property characteristics
-            - Give clear, helpful answers based on official building regulations
-            - Explain Building Act 2004 and Building Code requirements in plain terms
-            - Provide practical guidance on exemption conditions from Schedule 1
-            - Reference relevant building code requirements clearly
-            - Focus on helping users understand regulatory requirements
-
-            COMPREHENSIVE ANALYSIS APPROACH:
-            - When property address is provided and authentic data is available, integrate only verified information
-            - Cross-reference building regulations with confirmed property characteristics only
-            - Consider infrastructure limitations and planning restrictions only when provided in available knowledge
-            - Analyze development potential only based on confirmed regulatory requirements
-            - Provide regulatory cost estimates and timeframes based on official sources
-            - Focus on building consent requirements rather than market speculation
-
-            RESPONSE STYLE - STRUCTURED DECISION FORMAT:
-            ALWAYS start your response with one of these three categories:
-
-            YES: When you can definitively confirm based on multiple authoritative sources
-            - Use when Building Act 2004, Building Code, or council regulations clearly require something
-            - Use when exemption conditions are clearly met or not met
-            - Include specific clause references and exact requirements
-
-            NO: When you can definitively rule out based on authoritative sources  
-            - Use when Building Act 2004 or Building Code clearly exempts something
-            - Use when specific exemption conditions in Schedule 1 are clearly satisfied
-            - Include specific exemption clause references
-
-            MAYBE: When sources conflict, information is incomplete, or more details needed
-            - Use when user hasn't provided enough specific details
-            - Use when property-specific factors could change the answer
-            - Use when multiple interpretations are possible
-            - ALWAYS follow with specific questions to gather missing information
-            - Ask for: property address, project details, existing building information, specific measurements
-
-            After the YES/NO/MAYBE declaration:
-            - Integrate property-specific data throughout the response
-            - Combine regulatory requirements with market insights
-            - Provide comprehensive analysis using all available data
-            - Reference multiple official sources for verification
-            - Focus on helping users make informed property decisions
-
-            LOCATION-SPECIFIC CONSTRAINTS:
-            - Always check and mention relevant planning constraints
-            - Include zoning restrictions and their implications
-            - ONLY mention Hibiscus Coast constraints if the user specifically asks about: Orewa, Silverdale, Whangaparaoa, Red Beach, Stanmore Bay, Army Bay, or Hibiscus Coast area
-            - When Hibiscus Coast is relevant, provide exact Watercare policy details
-            - Consider infrastructure limitations in development advice
-
-            RESPONSE STYLE REQUIREMENTS:
-            - Provide DEFINITIVE, SPECIFIC answers with exact details from official sources
-            - Integrate data from multiple sources seamlessly
-            - When specific clauses are mentioned, quote them directly and prominently
-            - Lead with the most critical information first (especially infrastructure constraints)
-            - Include specific dates, deadlines, and policy details when available
-            - Always provide exact website links for verification
-            - State clear YES/NO answers where possible rather than general advice
-            - Write responses in plain text only without any markdown formatting
-            - Do NOT use hashtag symbols (#, ##, ###, ####) for headings
-            - Do NOT use asterisk symbols (**, *) for bold or italic text
-            - Use simple line breaks and colons for organization
-            - Prioritize actionable next steps over general explanations
-
-            CITATION REQUIREMENTS:
-            - Always include specific source references for all building regulations mentioned
-            - Create clickable links using markdown format [Link Text](URL) for official websites
-            - Reference specific Building Act 2004 sections and Building Code clauses
-            - Include properly formatted links to MBIE guidance documents, especially:
-              * [MBIE Building Consent Exemptions Guide](https://www.building.govt.nz/projects-and-consents/planning-a-successful-build/scope-and-design/check-if-you-need-consents/building-consent-exemptions-for-low-risk-work/schedule-1-guidance)
-              * [Building Code Requirements](https://www.building.govt.nz/building-code-compliance/)
-            - Mention specific council planning documents and zones when applicable
-            - Format citations with proper links within the text, not as a separate section
-            - Consistently promote our personalized property reports for comprehensive analysis`;
+      : PROPERTY_ADVISOR_PROMPT;
 
     const response = await fetch('https://api.openai.com/v1/chat/completions', {
       method: 'POST',
@@ -728,28 +636,7 @@ QUERY ANALYSIS:
 AVAILABLE KNOWLEDGE:
 ${clauseContext}${knowledgeContext}
 
-RESPONSE REQUIREMENTS:
-1. Start with YES, NO, or MAYBE based on the query analysis above
-2. For building consent questions: ALWAYS provide general Schedule 1 exemption guidance first
-3. Explain universal building consent thresholds (e.g., carports under 20m², buildings under 10m²)
-4. If MAYBE: Ask specific questions about missing technical details, not property information
-5. If YES/NO: Provide definitive answer with regulatory references
-6. Distinguish between building consent (universal rules) and planning consent (property-specific)
-7. If specific Building Code clauses were mentioned, quote them directly
-
-BUILDING CONSENT GUIDANCE APPROACH:
-- Always explain relevant Schedule 1 exemptions first
-- Provide general consent thresholds regardless of specific project details
-- Only ask for technical details needed to determine exemption applicability
-- Mention that planning consent may be separate requirement
-- Focus on Building Act 2004 requirements which apply universally
-
-IMPORTANT: 
-- Use YES only when regulations definitively require consent
-- Use NO only when regulations definitively exempt the work under Schedule 1
-- Use MAYBE when missing essential technical details only
-- Always provide general building consent guidance before asking for details
-- Respond using only plain text without hashtag or asterisk formatting`
+${RAG_RESPONSE_REQUIREMENTS}`
           }
         ],
         max_tokens: 2000,
@@ -39,6 +39,9 @@ import {
 import { db } from "./db";
 import { eq, desc, like, and, or, SQL } from "drizzle-orm";
 
+// Rows per multi-row INSERT, keeping bulk writes well under Postgres' bind parameter limit
+const INSERT_BATCH_SIZE = 500;
+
 export interface IStorage {
   // User operations
   getUser(id: string): Promise<User | undefined>;
@@ -91,6 +94,7 @@ export interface IStorage {
   getBuildingCodeSections(filters?: { category?: string; code?: string }): Promise<BuildingCodeSection[]>;
   getBuildingCodeSection(id: number): Promise<BuildingCodeSection | undefined>;
   createBuildingCodeSection(section: InsertBuildingCodeSection): Promise<BuildingCodeSection>;
+  createBuildingCodeSections(sections: InsertBuildingCodeSection[]): Promise<BuildingCodeSection[]>;
   updateBuildingCodeSection(id: number, section: Partial<InsertBuildingCodeSection>): Promise<BuildingCodeSection | undefined>;
   searchBuildingCodeSections(query: string): Promise<BuildingCodeSection[]>;
 
@@ -98,6 +102,7 @@ export interface IStorage {
   getPlanningRules(filters?: { region?: string; zone?: string; council?: string }): Promise<PlanningRule[]>;
   getPlanningRule(id: number): Promise<PlanningRule | undefined>;
   createPlanningRule(rule: InsertPlanningRule): Promise<PlanningRule>;
+  createPlanningRules(rules: InsertPlanningRule[]): Promise<PlanningRule[]>;
   updatePlanningRule(id: number, rule: Partial<InsertPlanningRule>): Promise<PlanningRule | undefined>;
   searchPlanningRules(query: string, region?: string): Promise<PlanningRule[]>;
 
@@ -105,6 +110,7 @@ export interface IStorage {
   getConsentRequirements(filters?: { activityType?: string; region?: string }): Promise<ConsentRequirement[]>;
   getConsentRequirement(id: number): Promise<ConsentRequirement | undefined>;
   createConsentRequirement(requirement: InsertConsentRequirement): Promise<ConsentRequirement>;
+  createConsentRequirements(requirements: InsertConsentRequirement[]): Promise<ConsentRequirement[]>;
   updateConsentRequirement(id: number, requirement: Partial<InsertConsentRequirement>): Promise<ConsentRequirement | undefined>;
   searchConsentRequirements(activityType: string): Promise<ConsentRequirement[]>;
 
@@ -456,6 +462,14 @@ export class DatabaseStorage implements IStorage {
     return result[0];
   }
 
+  async createBuildingCodeSections(sections: InsertBuildingCodeSection[]): Promise<BuildingCodeSection[]> {
+    const created: BuildingCodeSection[] = [];
+    for (let i = 0; i < sections.length; i += INSERT_BATCH_SIZE) {
+      created.push(...await db.insert(buildingCodeSections).values(sections.slice(i, i + INSERT_BATCH_SIZE)).returning());
+    }
+    return created;
+  }
+
   async updateBuildingCodeSection(id: number, section: Partial<InsertBuildingCodeSection>): Promise<BuildingCodeSection | undefined> {
     const result = await db.update(buildingCodeSections).set(section).where(eq(buildingCodeSections.id, id)).returning();
     return result[0];
@@ -503,6 +517,14 @@ export class DatabaseStorage implements IStorage {
     return result[0];
   }
 
+  async createPlanningRules(rules: InsertPlanningRule[]): Promise<PlanningRule[]> {
+    const created: PlanningRule[] = [];
+    for (let i = 0; i < rules.length; i += INSERT_BATCH_SIZE) {
+      created.push(...await db.insert(planningRules).values(rules.slice(i, i + INSERT_BATCH_SIZE)).returning());
+    }
+    return created;
+  }
+
   async updatePlanningRule(id: number, rule: Partial<InsertPlanningRule>): Promise<PlanningRule | undefined> {
     const result = await db.update(planningRules).set(rule).where(eq(planningRules.id, id)).returning();
     return result[0];
@@ -550,6 +572,14 @@ export class DatabaseStorage implements IStorage {
     return result[0];
   }
 
+  async createConsentRequirements(requirements: InsertConsentRequirement[]): Promise<ConsentRequirement[]> {
+    const created: ConsentRequirement[] = [];
+    for (let i = 0; i < requirements.length; i += INSERT_BATCH_SIZE) {
+      created.push(...await db.insert(consentRequirements).values(requirements.slice(i, i + INSERT_BATCH_SIZE)).returning());
+    }
+    return created;
+  }
+
   async updateConsentRequirement(id: number, requirement: Partial<InsertConsentRequirement>): Promise<ConsentRequirement | undefined> {
     const result = await db.update(consentRequirements).set(requirement).where(eq(consentRequirements.id, id)).returning();
     return result[0];